@@ -20,6 +20,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger('svg_transformer')
 
+# Precompiled patterns for parsing SVG transform attributes
+_TRANSFORM_OP_RE = re.compile(r'(\w+)\s*\(([^)]*)\)')
+_FLOAT_RE = re.compile(r'[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?')
+
+# Precompiled pattern for the angle of a rotate() transform
+_ROTATE_ANGLE_RE = re.compile(r'rotate\s*\(\s*([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)')
+
+# Precompiled patterns for the first moveto coordinates of path data
+_PATH_MOVE_COMMA_RE = re.compile(r'[mM]\s*([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s*,\s*([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)')
+_PATH_MOVE_SPACE_RE = re.compile(r'[mM]\s*([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s+([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)')
+
+# SVG element types converted to SCADA elements
+_SUPPORTED_ELEMENT_TYPES = frozenset(['rect', 'circle', 'ellipse', 'line', 'polyline', 'polygon', 'path'])
+
+# Rotation in degrees implied by a direction suffix on an element or group label
+_SUFFIX_ROTATION = {'r': 0, 'd': 90, 'l': 180, 'u': 270}
+
+# Affine transforms are composed as 6-tuples (a, b, c, d, e, f) standing for the
+# SVG matrix [[a, c, e], [b, d, f], [0, 0, 1]]. Plain float arithmetic on these
+# is much cheaper than np.matmul on tiny 3x3 arrays.
+_IDENTITY_AFFINE = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+def _multiply_affine(m, n):
+    """Return the product m x n of two affine 6-tuples."""
+    a1, b1, c1, d1, e1, f1 = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (
+        a1 * a2 + c1 * b2,
+        b1 * a2 + d1 * b2,
+        a1 * c2 + c1 * d2,
+        b1 * c2 + d1 * d2,
+        a1 * e2 + c1 * f2 + e1,
+        b1 * e2 + d1 * f2 + f1
+    )
+
+def _affine_to_matrix(affine):
+    """Expand an affine 6-tuple into a 3x3 NumPy transformation matrix."""
+    a, b, c, d, e, f = affine
+    return np.array([
+        [a, c, e],
+        [b, d, f],
+        [0.0, 0.0, 1.0]
+    ])
+
 # Add UI-compatible print function
 def ui_print(message, level=logging.INFO):
     """Print a message to both the logger and stdout for UI capture."""
@@ -41,160 +85,200 @@ class SVGTransformer:
         self.custom_options = custom_options or {}
         self.debug = debug
         
+        # Combined group transform per DOM node, shared by all descendants
+        self._ancestor_transform_cache = {}
+        
+        # Lookup tables for element_mappings, rebuilt by each process_svg call
+        self._index_element_mappings()
+        
+        # Document height, read on first use by path processing
+        self._svg_height = None
+        
         # Set logging level based on debug flag
         if self.debug:
             logger.setLevel(logging.DEBUG)
         
-        # Debug print the custom_options
-        ui_print("DEBUG: Loaded custom_options:")
+        # Log the loaded custom_options
+        logger.debug("Loaded custom_options:")
         if 'element_mappings' in self.custom_options:
-            ui_print(f"DEBUG: Found {len(self.custom_options['element_mappings'])} element mappings")
+            logger.debug("Found %s element mappings", len(self.custom_options['element_mappings']))
             for i, mapping in enumerate(self.custom_options['element_mappings']):
-                ui_print(f"DEBUG: Mapping #{i+1}: svg_type='{mapping.get('svg_type')}', label_prefix='{mapping.get('label_prefix')}', props_path='{mapping.get('props_path')}'")
+                logger.debug("Mapping #%s: svg_type='%s', label_prefix='%s', props_path='%s'", i+1, mapping.get('svg_type'), mapping.get('label_prefix'), mapping.get('props_path'))
         else:
-            ui_print("DEBUG: No element_mappings found in custom_options")
+            logger.debug("No element_mappings found in custom_options")
+        
+    def _index_element_mappings(self):
+        """
+        Index element_mappings for constant-time lookups.
+        
+        Each table keeps the first mapping for a key, matching the order in
+        which a linear scan over element_mappings would find it. The offset
+        fallback table keeps the last one, as the offset lookup always has.
         
+        process_svg rebuilds the tables on every run. Callers that change
+        custom_options['element_mappings'] and then use the per-element
+        methods directly must call this again first.
+        """
+        self._mapping_by_type_and_prefix = {}
+        self._mapping_by_type_and_prefix_ci = {}
+        self._mapping_by_prefix = {}
+        self._mapping_by_prefix_ci = {}
+        self._last_unprefixed_mapping_by_type = {}
+        
+        for mapping in self.custom_options.get('element_mappings', []):
+            svg_type = mapping.get('svg_type', '')
+            prefix = mapping.get('label_prefix', '') or ''
+            if not prefix:
+                self._last_unprefixed_mapping_by_type[svg_type] = mapping
+            self._mapping_by_type_and_prefix.setdefault((svg_type, prefix), mapping)
+            self._mapping_by_type_and_prefix_ci.setdefault((svg_type, prefix.upper()), mapping)
+            self._mapping_by_prefix.setdefault(prefix, mapping)
+            self._mapping_by_prefix_ci.setdefault(prefix.upper(), mapping)
+    
     def get_svg_dimensions(self):
         """Get the dimensions of the SVG document."""
         width = float(self.svg_element.getAttribute('width') or 0)
         height = float(self.svg_element.getAttribute('height') or 0)
         return width, height
     
+    def _get_svg_height(self):
+        """Get the document height, reading the root attribute only once."""
+        if self._svg_height is None:
+            self._svg_height = float(self.svg_element.getAttribute('height') or 0)
+        return self._svg_height
+    
     def parse_transform(self, transform_str):
         """Parse SVG transform attribute and return transformation matrix."""
         if not transform_str:
             return np.identity(3)
         
-        # Initialize transformation matrix as identity
-        matrix = np.identity(3)
+        return _affine_to_matrix(self._parse_affine(transform_str))
+    
+    def _parse_affine(self, transform_str):
+        """Parse SVG transform attribute and return it as an affine 6-tuple."""
+        # Fast path for the single matrix(a,b,c,d,e,f) transform Inkscape writes
+        stripped = transform_str.strip()
+        if stripped.startswith('matrix(') and stripped.endswith(')') and stripped.count('(') == 1:
+            values = _FLOAT_RE.findall(stripped[7:-1])
+            if len(values) == 6:
+                return tuple(float(v) for v in values)
+        
+        # Initialize transformation as identity
+        affine = _IDENTITY_AFFINE
         
         try:
             # Find all transformation operations
-            for op in re.finditer(r'(\w+)\s*\(([^)]*)\)', transform_str):
+            for op in _TRANSFORM_OP_RE.finditer(transform_str):
                 op_name = op.group(1)
                 params_str = op.group(2)
                 
                 # Extract parameters safely
                 try:
-                    params = [float(x) for x in re.findall(r'[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?', params_str)]
-                    matrix = self._apply_operation_to_matrix(matrix, op_name, params)
+                    params = [float(x) for x in _FLOAT_RE.findall(params_str)]
+                    op_affine = self._operation_affine(op_name, params)
+                    if op_affine is not None:
+                        affine = _multiply_affine(affine, op_affine)
                 except (ValueError, TypeError) as e:
                     logger.error(f"Error parsing transform parameters '{params_str}': {e}")
                     # Continue with the current matrix rather than failing
         except Exception as e:
             logger.error(f"Error parsing transform '{transform_str}': {e}")
-            return np.identity(3)
+            return _IDENTITY_AFFINE
             
-        return matrix
+        return affine
     
-    def _apply_operation_to_matrix(self, matrix, op_name, params):
-        """Apply a specific transform operation to the matrix."""
+    def _operation_affine(self, op_name, params):
+        """Return the affine 6-tuple for a single transform operation, or None if unsupported."""
         if op_name == 'matrix' and len(params) == 6:
-            transform_matrix = np.array([
-                [params[0], params[2], params[4]],
-                [params[1], params[3], params[5]],
-                [0, 0, 1]
-            ])
-            return np.matmul(matrix, transform_matrix)
+            return tuple(params)
             
         elif op_name == 'translate':
             tx = params[0]
-            ty = params[1] if len(params) > 1 else 0
-            translation_matrix = np.array([
-                [1, 0, tx],
-                [0, 1, ty],
-                [0, 0, 1]
-            ])
-            return np.matmul(matrix, translation_matrix)
+            ty = params[1] if len(params) > 1 else 0.0
+            return (1.0, 0.0, 0.0, 1.0, tx, ty)
             
         elif op_name == 'scale':
             sx = params[0]
             sy = params[1] if len(params) > 1 else sx
-            scale_matrix = np.array([
-                [sx, 0, 0],
-                [0, sy, 0],
-                [0, 0, 1]
-            ])
-            return np.matmul(matrix, scale_matrix)
+            return (sx, 0.0, 0.0, sy, 0.0, 0.0)
             
         elif op_name == 'rotate':
-            return self._handle_rotation(matrix, params)
+            return self._rotation_affine(params)
             
-        return matrix  # Return unchanged matrix for unsupported operations
+        return None  # Unsupported operations leave the transform unchanged
     
-    def _handle_rotation(self, matrix, params):
-        """Handle rotation transform operations."""
+    def _rotation_affine(self, params):
+        """Return the affine 6-tuple for a rotate transform operation."""
         angle_rad = math.radians(params[0])
         cos_a = math.cos(angle_rad)
         sin_a = math.sin(angle_rad)
+        rotation = (cos_a, sin_a, -sin_a, cos_a, 0.0, 0.0)
         
         if len(params) == 3:  # rotate around point
             cx, cy = params[1], params[2]
-            # Translate to origin, rotate, translate back
-            translation_to_origin = np.array([
-                [1, 0, -cx],
-                [0, 1, -cy],
-                [0, 0, 1]
-            ])
-            rotation = np.array([
-                [cos_a, -sin_a, 0],
-                [sin_a, cos_a, 0],
-                [0, 0, 1]
-            ])
-            translation_back = np.array([
-                [1, 0, cx],
-                [0, 1, cy],
-                [0, 0, 1]
-            ])
-            transform = np.matmul(np.matmul(translation_to_origin, rotation), translation_back)
-            return np.matmul(matrix, transform)
-        else:  # rotate around origin
-            rotation = np.array([
-                [cos_a, -sin_a, 0],
-                [sin_a, cos_a, 0],
-                [0, 0, 1]
-            ])
-            return np.matmul(matrix, rotation)
+            # Translate to origin, rotate, translate back, collapsed into one affine
+            return (cos_a, sin_a, -sin_a, cos_a,
+                    cos_a * cx - sin_a * cy - cx,
+                    sin_a * cx + cos_a * cy - cy)
+        
+        # rotate around origin
+        return rotation
     
     def apply_transform(self, point, transform_matrix):
         """Apply transformation matrix to a point."""
-        # Convert point to homogeneous coordinates
-        point_h = np.array([point[0], point[1], 1])
-        
-        # Apply transformation
-        transformed = np.matmul(transform_matrix, point_h)
+        # SVG transforms are affine, so the homogeneous row is always [0, 0, 1]
+        x, y = point[0], point[1]
+        m = transform_matrix
+        transformed = (m[0, 0] * x + m[0, 1] * y + m[0, 2],
+                       m[1, 0] * x + m[1, 1] * y + m[1, 2])
         
         # For debugging
         if self.debug:
-            logger.debug(f"Applying transform to point {point} with matrix {transform_matrix} → result: ({transformed[0]}, {transformed[1]})")
+            logger.debug("Applying transform to point %s with matrix %s → result: (%s, %s)", point, transform_matrix, transformed[0], transformed[1])
         
-        # Convert back from homogeneous coordinates
-        return transformed[0], transformed[1]
+        return transformed
     
     def get_all_transforms(self, element):
         """Get all transforms from element up through parent groups."""
-        transform_matrices = []
+        # Get transforms from parent groups
+        combined = self._get_ancestor_affine(element.parentNode)
         
         # Get transform from the current element
         transform_str = element.getAttribute('transform')
         if transform_str:
-            transform_matrices.append(self.parse_transform(transform_str))
+            combined = _multiply_affine(self._parse_affine(transform_str), combined)
         
-        # Get transforms from parent groups
-        current = element.parentNode
+        return _affine_to_matrix(combined)
+    
+    def _get_ancestor_affine(self, node):
+        """
+        Get the combined group transforms from node up to the document root.
+        
+        Results are cached per node, so sibling elements and nested groups
+        reuse the parsed transforms of their shared ancestors.
+        """
+        cache = self._ancestor_transform_cache
+        
+        # Walk up until we reach a cached ancestor or leave the element tree
+        uncached = []
+        combined = _IDENTITY_AFFINE
+        current = node
         while current and current.nodeType == current.ELEMENT_NODE:
+            if current in cache:
+                combined = cache[current]
+                break
+            uncached.append(current)
+            current = current.parentNode
+        
+        # Combine transforms from the outermost uncached node inwards
+        for current in reversed(uncached):
             if current.tagName == 'g':
                 transform_str = current.getAttribute('transform')
                 if transform_str:
-                    transform_matrices.append(self.parse_transform(transform_str))
-            current = current.parentNode
+                    combined = _multiply_affine(self._parse_affine(transform_str), combined)
+            cache[current] = combined
         
-        # Combine all transforms (from innermost to outermost)
-        combined_matrix = np.identity(3)
-        for matrix in reversed(transform_matrices):
-            combined_matrix = np.matmul(matrix, combined_matrix)
-        
-        return combined_matrix
+        return combined
     
     def get_element_type_for_svg_type(self, svg_type):
         """
@@ -218,22 +302,18 @@ class SVGTransformer:
         exact_match = None
         fallback_match = None
         
-        logger.debug(f"Looking for mapping for svg_type={svg_type}, label_prefix='{label_prefix}'")
+        logger.debug("Looking for mapping for svg_type=%s, label_prefix='%s'", svg_type, label_prefix)
         
-        # First pass: look for an exact match
+        # First look for an exact match
         if label_prefix:  # Only look for exact match if we have a prefix
-            for mapping in self.custom_options['element_mappings']:
-                if mapping['svg_type'] == svg_type and mapping.get('label_prefix', '') == label_prefix:
-                    exact_match = mapping
-                    logger.debug(f"Found exact match: {mapping}")
-                    break
-        
-        # Second pass: look for a fallback match (no prefix)
-        for mapping in self.custom_options['element_mappings']:
-            if mapping['svg_type'] == svg_type and not mapping.get('label_prefix', ''):
-                fallback_match = mapping
-                logger.debug(f"Found fallback match: {mapping}")
-                break
+            exact_match = self._mapping_by_type_and_prefix.get((svg_type, label_prefix))
+            if exact_match:
+                logger.debug("Found exact match: %s", exact_match)
+        
+        # Then look for a fallback match (no prefix)
+        fallback_match = self._mapping_by_type_and_prefix.get((svg_type, ''))
+        if fallback_match:
+            logger.debug("Found fallback match: %s", fallback_match)
         
         # Use the exact match if found, otherwise try the fallback
         if exact_match and 'element_type' in exact_match:
@@ -250,20 +330,15 @@ class SVGTransformer:
         if element_width is None:
             element_width = self.custom_options.get('width', 10)
             if self.debug:
-                logger.debug(f"Using fallback width: {element_width}")
+                logger.debug("Using fallback width: %s", element_width)
         if element_height is None:
             element_height = self.custom_options.get('height', 10)
             if self.debug:
-                logger.debug(f"Using fallback height: {element_height}")
-            
-        # Store debug buffer contents if provided
-        debug_messages = []
-        if debug_buffer is not None:
-            debug_messages = debug_buffer.copy()
+                logger.debug("Using fallback height: %s", element_height)
             
         # Log all debug messages to the console for transparency
         if self.debug:
-            for msg in debug_messages:
+            for msg in debug_buffer or ():
                 logger.debug(msg)
             
             logger.debug("==== END DEBUG ====")
@@ -273,28 +348,22 @@ class SVGTransformer:
         exact_match = None
         fallback_match = None
         
-        logger.debug(f"Looking for mapping for svg_type={svg_type}, label_prefix='{label_prefix}'")
-        logger.debug(f"Available mappings: {len(self.custom_options.get('element_mappings', []))}")
-        
         # Debug print all available mappings
         if self.debug:
+            logger.debug("Looking for mapping for svg_type=%s, label_prefix='%s'", svg_type, label_prefix)
+            logger.debug("Available mappings: %s", len(self.custom_options.get('element_mappings', [])))
             for i, mapping in enumerate(self.custom_options.get('element_mappings', [])):
-                logger.debug(f"  Available mapping #{i+1}: svg_type={mapping.get('svg_type', 'None')}, label_prefix='{mapping.get('label_prefix', '')}'")
+                logger.debug("  Available mapping #%s: svg_type=%s, label_prefix='%s'", i+1, mapping.get('svg_type', 'None'), mapping.get('label_prefix', ''))
         
-        if 'element_mappings' in self.custom_options and label_prefix:
-            for mapping in self.custom_options['element_mappings']:
-                if mapping.get('svg_type', '') == svg_type and mapping.get('label_prefix', '') == label_prefix:
-                    exact_match = mapping
-                    logger.debug(f"Found exact match: {mapping}")
-                    break
+        if label_prefix:
+            exact_match = self._mapping_by_type_and_prefix.get((svg_type, label_prefix))
+            if self.debug and exact_match:
+                logger.debug("Found exact match: %s", exact_match)
         
         # Then look for a fallback with no prefix
-        for mapping in self.custom_options.get('element_mappings', []):
-            if mapping['svg_type'] == svg_type and not mapping.get('label_prefix', ''):
-                fallback_match = mapping
-                if not exact_match:  # Only print if we haven't found an exact match
-                    logger.debug(f"Found fallback match: {mapping}")
-                break
+        fallback_match = self._mapping_by_type_and_prefix.get((svg_type, ''))
+        if self.debug and fallback_match and not exact_match:  # Only print if we haven't found an exact match
+            logger.debug("Found fallback match: %s", fallback_match)
         
         # Use the appropriate mapping
         mapping_to_use = exact_match or fallback_match
@@ -306,9 +375,10 @@ class SVGTransformer:
         if mapping_to_use:
             element_type = mapping_to_use.get('element_type', element_type)
             props_path = mapping_to_use.get('props_path', props_path)
-            logger.debug(f"Selected mapping: {mapping_to_use}")
-            logger.debug(f"Using element_type: {element_type} from {'exact match' if exact_match else 'fallback match'}")
-            logger.debug(f"Using props_path: {props_path} from {'exact match' if exact_match else 'fallback match'}")
+            if self.debug:
+                logger.debug("Selected mapping: %s", mapping_to_use)
+                logger.debug("Using element_type: %s from %s", element_type, 'exact match' if exact_match else 'fallback match')
+                logger.debug("Using props_path: %s from %s", props_path, 'exact match' if exact_match else 'fallback match')
         else:
             warning_msg = f"WARNING: No mapping found for svg_type={svg_type}, label_prefix='{label_prefix}'. Using defaults: type={element_type}, props={props_path}"
             logger.warning(warning_msg)
@@ -342,7 +412,7 @@ class SVGTransformer:
                 if not meta['elementPrefix']:
                     meta['elementPrefix'] = mapping_to_use.get('label_prefix', '')
                     if self.debug:
-                        logger.debug(f"Setting elementPrefix to '{meta['elementPrefix']}' based on mapping that provided final_prefix")
+                        logger.debug("Setting elementPrefix to '%s' based on mapping that provided final_prefix", meta['elementPrefix'])
             
             if final_suffix:
                 meta['finalSuffixApplied'] = final_suffix
@@ -434,10 +504,10 @@ class SVGTransformer:
     def process_element(self, element, element_count, svg_type):
         """Process a single SVG element and return its JSON representation."""
         try:
-            debug_buffer = []  # Collect debug messages
+            debug_buffer = [] if self.debug else None  # Collect debug messages
             
             if self.debug:
-                logger.debug(f"Processing {svg_type} #{element_count}")
+                logger.debug("Processing %s #%s", svg_type, element_count)
                 debug_buffer.append(f"Processing {svg_type} #{element_count}")
             
             # Initialize transformed coordinates
@@ -453,28 +523,26 @@ class SVGTransformer:
             # Get the prefix from the label (text before underscore)
             candidate_prefix = ""
             if element_label and "_" in element_label:
-                candidate_prefix = element_label.split("_")[0]
+                candidate_prefix = element_label.split("_", 1)[0]
             
             # Only treat it as a prefix if it exists in the mappings
             label_prefix = ""
             if 'element_mappings' in self.custom_options and candidate_prefix:
-                prefix_exists = False
-                for mapping in self.custom_options['element_mappings']:
-                    # Case-insensitive comparison
-                    if mapping.get('label_prefix', '').upper() == candidate_prefix.upper():
-                        prefix_exists = True
-                        # Use the prefix as defined in the mapping (preserve case from mapping)
-                        label_prefix = mapping.get('label_prefix', '')
-                        break
+                # Case-insensitive lookup
+                mapping = self._mapping_by_prefix_ci.get(candidate_prefix.upper())
+                prefix_exists = mapping is not None
+                if prefix_exists:
+                    # Use the prefix as defined in the mapping (preserve case from mapping)
+                    label_prefix = mapping.get('label_prefix', '')
                 
                 # Only use the prefix if it's defined in the mappings
                 if prefix_exists:
-                    logger.debug(f"Found valid prefix '{label_prefix}' in mappings for element {element_label}")
+                    logger.debug("Found valid prefix '%s' in mappings for element %s", label_prefix, element_label)
                 else:
-                    logger.debug(f"Extracted prefix '{candidate_prefix}' not found in mappings, treating as no prefix")
+                    logger.debug("Extracted prefix '%s' not found in mappings, treating as no prefix", candidate_prefix)
             
             if self.debug:
-                logger.debug(f"Final label_prefix for {element_label}: '{label_prefix}'")
+                logger.debug("Final label_prefix for %s: '%s'", element_label, label_prefix)
             
             # Get original element coordinates and dimensions
             # Process based on element type
@@ -486,7 +554,7 @@ class SVGTransformer:
             element_height = None
             
             if self.debug:
-                logger.debug(f"Processing element: {element_name} (SVG type: {svg_type})")
+                logger.debug("Processing element: %s (SVG type: %s)", element_name, svg_type)
             
             if svg_type == 'rect':
                 x = float(element.getAttribute('x') or 0)
@@ -537,20 +605,22 @@ class SVGTransformer:
                 if svg_type == 'path':
                     d_attr = element.getAttribute('d')
                     if d_attr:
-                        logger.debug(f"Processing path with data: {d_attr}")
+                        logger.debug("Processing path with data: %s", d_attr)
                         
                         # For special debugging
-                        logger.debug(f"*** Y-COORDINATE DEBUG ***")
+                        logger.debug("*** Y-COORDINATE DEBUG ***")
                         
                         # Extract the first x,y coordinates from the path data
                         # Path data typically starts with "m" or "M" followed by x,y coordinates
                         # Try to match coordinates with comma separator (most common)
-                        comma_separated = re.findall(r'[mM]\s*([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s*,\s*([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)', d_attr)
+                        # Only the first match is used, so stop scanning the path data there
+                        comma_match = _PATH_MOVE_COMMA_RE.search(d_attr)
+                        comma_separated = [comma_match.groups()] if comma_match else []
                         
                         # If not found, try to match coordinates with space separator
                         space_separated = []
                         if not comma_separated:
-                            space_match = re.search(r'[mM]\s*([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s+([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)', d_attr)
+                            space_match = _PATH_MOVE_SPACE_RE.search(d_attr)
                             if space_match:
                                 space_separated = [(space_match.group(1), space_match.group(2))]
                         
@@ -559,11 +629,11 @@ class SVGTransformer:
                         
                         # For debugging
                         if comma_separated:
-                            logger.debug(f"Found comma-separated coordinates")
+                            logger.debug("Found comma-separated coordinates")
                         elif space_separated:
-                            logger.debug(f"Found space-separated coordinates")
+                            logger.debug("Found space-separated coordinates")
                         else:
-                            logger.debug(f"Could not find coordinates with standard patterns")
+                            logger.debug("Could not find coordinates with standard patterns")
                         
                         # Determine if we're using relative coordinates (lowercase 'm' means relative)
                         is_relative = d_attr.strip().startswith('m')
@@ -574,26 +644,26 @@ class SVGTransformer:
                                 x_str = path_coords[0][0]
                                 y_str = path_coords[0][1]
                                 
-                                logger.debug(f"Raw extracted values - x_str: '{x_str}', y_str: '{y_str}'")
+                                logger.debug("Raw extracted values - x_str: '%s', y_str: '%s'", x_str, y_str)
                                 
                                 # Convert to float
                                 orig_center_x = float(x_str)
                                 orig_center_y = float(y_str)
                                 
-                                logger.debug(f"After float conversion - x: {orig_center_x}, y: {orig_center_y}")
-                                logger.debug(f"Extracted path starting coordinates: ({orig_center_x}, {orig_center_y}) - {'Relative' if is_relative else 'Absolute'} coordinates")
+                                logger.debug("After float conversion - x: %s, y: %s", orig_center_x, orig_center_y)
+                                logger.debug("Extracted path starting coordinates: (%s, %s) - %s coordinates", orig_center_x, orig_center_y, 'Relative' if is_relative else 'Absolute')
                             except (ValueError, IndexError) as e:
-                                logger.debug(f"Error extracting path coordinates: {e}")
+                                logger.debug("Error extracting path coordinates: %s", e)
                         else:
-                            logger.debug(f"Could not extract coordinates from path data: {d_attr}")
+                            logger.debug("Could not extract coordinates from path data: %s", d_attr)
                 
-                logger.debug(f"Warning: {svg_type} element support is basic - center may not be accurate")
+                logger.debug("Warning: %s element support is basic - center may not be accurate", svg_type)
             else:
                 # Default case for unsupported types
                 orig_center_x, orig_center_y = 0, 0
                 original_width = 10  # Default
                 original_height = 10  # Default
-                logger.debug(f"Warning: Unsupported element type {svg_type}")
+                logger.debug("Warning: Unsupported element type %s", svg_type)
             
             # Get transformation matrix from all parent transforms
             transform_matrix = self.get_all_transforms(element)
@@ -601,7 +671,7 @@ class SVGTransformer:
             # Print the original transform string for debugging
             transform_str = element.getAttribute('transform')
             if transform_str:
-                logger.debug(f"Element has transform: {transform_str}")
+                logger.debug("Element has transform: %s", transform_str)
             
             # Extract rotation angle from the transform
             rotation_angle = self.extract_rotation_from_transform(element)
@@ -612,12 +682,12 @@ class SVGTransformer:
             )
             
             # For debugging - print transformation details for path elements
-            if svg_type == 'path':
-                logger.debug(f"TRANSFORM DEBUG - Original: ({orig_center_x}, {orig_center_y}), Transformed: ({transformed_center_x}, {transformed_center_y})")
+            if self.debug and svg_type == 'path':
+                logger.debug("TRANSFORM DEBUG - Original: (%s, %s), Transformed: (%s, %s)", orig_center_x, orig_center_y, transformed_center_x, transformed_center_y)
                 
                 # Print transform matrix if available
                 if transform_matrix is not None and not np.array_equal(transform_matrix, np.identity(3)):
-                    logger.debug(f"Transform Matrix: {transform_matrix}")
+                    logger.debug("Transform Matrix: %s", transform_matrix)
             
             # Get element identifiers - this section is duplicated, let's remove it 
             # element_id = element.getAttribute('id') or ""
@@ -635,11 +705,8 @@ class SVGTransformer:
             exact_prefix_match = None
             
             if 'element_mappings' in self.custom_options and label_prefix:
-                for mapping in self.custom_options['element_mappings']:
-                    if mapping.get('label_prefix', '') == label_prefix:
-                        has_prefix_mapping = True
-                        exact_prefix_match = mapping
-                        break
+                exact_prefix_match = self._mapping_by_prefix.get(label_prefix)
+                has_prefix_mapping = exact_prefix_match is not None
             
             # Get element dimensions from the prefix mapping if available
             element_width = None
@@ -651,7 +718,7 @@ class SVGTransformer:
                     element_width = exact_prefix_match['width']
                 if 'height' in exact_prefix_match:
                     element_height = exact_prefix_match['height']
-                logger.debug(f"Using dimensions from prefix mapping '{label_prefix}': {element_width}x{element_height}")
+                logger.debug("Using dimensions from prefix mapping '%s': %sx%s", label_prefix, element_width, element_height)
             
             # Get size mapping based on element type
             if element_width is None or element_height is None:
@@ -661,19 +728,19 @@ class SVGTransformer:
                         element_width = size_mapping['width']
                     if element_height is None and 'height' in size_mapping:
                         element_height = size_mapping['height']
-                    logger.debug(f"Using dimensions from element_size_mapping: {element_width}x{element_height}")
-                    logger.debug(f"DEBUG: Using size mapping for {svg_type}: width={element_width}, height={element_height}")
+                    logger.debug("Using dimensions from element_size_mapping: %sx%s", element_width, element_height)
+                    logger.debug("DEBUG: Using size mapping for %s: width=%s, height=%s", svg_type, element_width, element_height)
             
             # If still no dimensions, try direct custom_options
             if element_width is None:
                 element_width = self.custom_options.get('width', 10)
-                logger.debug(f"DEBUG: Using fallback width: {element_width}")
+                logger.debug("DEBUG: Using fallback width: %s", element_width)
             if element_height is None:
                 element_height = self.custom_options.get('height', 10)
-                logger.debug(f"DEBUG: Using fallback height: {element_height}")
+                logger.debug("DEBUG: Using fallback height: %s", element_height)
             
-            logger.debug(f"Final dimensions for {element_name}: {element_width}x{element_height}")
-            logger.debug(f"DEBUG: Final dimensions for {element_name}: {element_width}x{element_height}")
+            logger.debug("Final dimensions for %s: %sx%s", element_name, element_width, element_height)
+            logger.debug("DEBUG: Final dimensions for %s: %sx%s", element_name, element_width, element_height)
             
             # Initialize final_x and final_y with default values
             final_x = transformed_center_x
@@ -684,29 +751,29 @@ class SVGTransformer:
                 # Special handling for path elements
                 
                 # Additional debugging for y-coordinate issue
-                svg_height = float(self.svg_element.getAttribute('height') or 0)
-                logger.debug(f"SVG HEIGHT: {svg_height}")
+                svg_height = self._get_svg_height()
+                logger.debug("SVG HEIGHT: %s", svg_height)
                 
                 # Force using original path coordinates option
                 use_original_path_coords = self.custom_options.get('use_original_path_coords', False)
                 
                 if use_original_path_coords:
-                    logger.debug(f"USING ORIGINAL PATH COORDINATES - Original: ({orig_center_x}, {orig_center_y})")
+                    logger.debug("USING ORIGINAL PATH COORDINATES - Original: (%s, %s)", orig_center_x, orig_center_y)
                     final_x = orig_center_x
                     final_y = orig_center_y
                 else:
                     # Check if y-coordinate seems to be inverted (common in some SVG processing)
                     if svg_height > 0 and abs(svg_height - orig_center_y) < 100:
-                        logger.debug(f"POSSIBLE Y-INVERSION DETECTED: SVG height={svg_height}, y-coord={orig_center_y}")
-                        logger.debug(f"Testing if y-coordinate is being flipped from bottom-left to top-left origin")
+                        logger.debug("POSSIBLE Y-INVERSION DETECTED: SVG height=%s, y-coord=%s", svg_height, orig_center_y)
+                        logger.debug("Testing if y-coordinate is being flipped from bottom-left to top-left origin")
                         
                         # Try using the y-coordinate directly from the path data
                         # without any transformation
                         if 'y_coordinate_handling' in self.custom_options and self.custom_options['y_coordinate_handling'] == 'preserve':
-                            logger.debug(f"Using preserve mode for y-coordinate")
+                            logger.debug("Using preserve mode for y-coordinate")
                             final_y = orig_center_y
                 
-                logger.debug(f"Using path coordinates directly: ({final_x}, {final_y})")
+                logger.debug("Using path coordinates directly: (%s, %s)", final_x, final_y)
                 
                 # For path elements, explicitly set element_width and element_height to be used for display purposes
                 # but they don't affect the positioning
@@ -715,12 +782,12 @@ class SVGTransformer:
                         element_width = exact_prefix_match['width']
                     if 'height' in exact_prefix_match:
                         element_height = exact_prefix_match['height']
-                    logger.debug(f"Using display dimensions for path from mapping: {element_width}x{element_height}")
+                    logger.debug("Using display dimensions for path from mapping: %sx%s", element_width, element_height)
             else:
                 # For non-path elements, calculate the centered position
                 final_x = transformed_center_x - element_width / 2
                 final_y = transformed_center_y - element_height / 2
-                logger.debug(f"Calculated centered position: ({final_x}, {final_y})")
+                logger.debug("Calculated centered position: (%s, %s)", final_x, final_y)
             
             # Apply x_offset and y_offset from mapping if available
             x_offset = 0
@@ -729,16 +796,8 @@ class SVGTransformer:
             # Get x_offset and y_offset from mappings based on svg_type and label_prefix
             if 'element_mappings' in self.custom_options:
                 # Find best match (exact match with label prefix first, then fallback to no prefix)
-                exact_match = None
-                fallback_match = None
-                
-                for mapping in self.custom_options['element_mappings']:
-                    if mapping.get('svg_type', '') == svg_type:
-                        if mapping.get('label_prefix', '') == label_prefix:
-                            exact_match = mapping
-                            break
-                        elif not mapping.get('label_prefix', ''):
-                            fallback_match = mapping
+                exact_match = self._mapping_by_type_and_prefix.get((svg_type, label_prefix))
+                fallback_match = self._last_unprefixed_mapping_by_type.get(svg_type)
                 
                 # Use exact match if found, otherwise use fallback
                 mapping_to_use = exact_match or fallback_match
@@ -755,39 +814,39 @@ class SVGTransformer:
             final_x += x_offset
             final_y += y_offset
             
-            logger.debug(f"Applied offsets: x_offset={x_offset}, y_offset={y_offset}")
+            logger.debug("Applied offsets: x_offset=%s, y_offset=%s", x_offset, y_offset)
             
             suffix = None
             
             # Check for specific suffixes to override rotation
             if element_name and len(element_name) >= 2:
                 last_char = element_name[-1].lower()
-                if last_char in ['r', 'd', 'l', 'u']:
+                if last_char in _SUFFIX_ROTATION:
                     suffix = last_char
                     # Store original rotation for debug output
                     original_rotation = rotation_angle
                     
                     # Override rotation based on suffix
-                    if last_char == 'r':
-                        rotation_angle = 0
-                    elif last_char == 'd':
-                        rotation_angle = 90
-                    elif last_char == 'l':
-                        rotation_angle = 180
-                    elif last_char == 'u':
-                        rotation_angle = 270
+                    rotation_angle = _SUFFIX_ROTATION[last_char]
                     
                     # Log that we're overriding the rotation
-                    logger.debug(f"SUFFIX ROTATION OVERRIDE: Suffix '{last_char}' changed rotation from {original_rotation}deg to {rotation_angle}deg")
+                    logger.debug("SUFFIX ROTATION OVERRIDE: Suffix '%s' changed rotation from %sdeg to %sdeg", last_char, original_rotation, rotation_angle)
             
             # Log detailed positioning information for debugging
-            logger.debug(f"{svg_type.capitalize()} #{element_count}: {element_name}, " 
-                  f"Original center: ({orig_center_x}, {orig_center_y}), "
-                  f"Transformed center: ({transformed_center_x}, {transformed_center_y}), "
-                  f"Final position: ({final_x}, {final_y}), "
-                  f"Using element size: {element_width}x{element_height}, "
-                  f"Offsets: (x={x_offset}, y={y_offset}), "
-                  f"Rotation: {rotation_angle}deg")
+            logger.debug("%s #%s: %s, "
+                  "Original center: (%s, %s), "
+                  "Transformed center: (%s, %s), "
+                  "Final position: (%s, %s), "
+                  "Using element size: %sx%s, "
+                  "Offsets: (x=%s, y=%s), "
+                  "Rotation: %sdeg",
+                  svg_type.capitalize(), element_count, element_name,
+                  orig_center_x, orig_center_y,
+                  transformed_center_x, transformed_center_y,
+                  final_x, final_y,
+                  element_width, element_height,
+                  x_offset, y_offset,
+                  rotation_angle)
             
             # Clean the element name by removing prefix/suffix AFTER logging
             cleaned_name = self.clean_element_name(
@@ -800,7 +859,7 @@ class SVGTransformer:
             
             # Log information about name cleaning
             if cleaned_name != element_name:
-                logger.debug(f"Cleaned element name: '{element_name}' → '{cleaned_name}' [Prefix mapping: {has_prefix_mapping}, Suffix: {suffix}]")
+                logger.debug("Cleaned element name: '%s' → '%s' [Prefix mapping: %s, Suffix: %s]", element_name, cleaned_name, has_prefix_mapping, suffix)
                 element_name = cleaned_name
             
             # Now create JSON with element name, position, and other properties
@@ -838,11 +897,11 @@ class SVGTransformer:
             return 0
         
         # First try direct extraction for rotate transform
-        direct_rotate = re.search(r'rotate\s*\(\s*([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)', transform_str)
+        direct_rotate = _ROTATE_ANGLE_RE.search(transform_str) if 'rotate' in transform_str else None
         if direct_rotate:
             try:
                 angle = float(direct_rotate.group(1))
-                logger.debug(f"Directly extracted rotation angle: {angle} degrees")
+                logger.debug("Directly extracted rotation angle: %s degrees", angle)
                 return angle
             except Exception as e:
                 logger.error(f"Error extracting direct rotation: {e}")
@@ -864,7 +923,7 @@ class SVGTransformer:
             angle_rad = math.atan2(b, a)
             angle_deg = math.degrees(angle_rad)
             
-            logger.debug(f"Extracted rotation from transform matrix: {angle_deg} degrees")
+            logger.debug("Extracted rotation from transform matrix: %s degrees", angle_deg)
             
             return angle_deg
             
@@ -876,8 +935,8 @@ class SVGTransformer:
         """Create a default element when processing fails."""
         element_name = f"error_{svg_type}{element_count}"
         
-        logger.debug(f"DEBUG: Creating default element due to error: {error_msg}")
-        logger.debug(f"DEBUG: Default element name: {element_name}, type: {svg_type}")
+        logger.debug("DEBUG: Creating default element due to error: %s", error_msg)
+        logger.debug("DEBUG: Default element name: %s, type: %s", element_name, svg_type)
         
         return {
             "type": "ia.display.view",
@@ -925,6 +984,9 @@ class SVGTransformer:
     
     def process_svg(self):
         """Process SVG file and extract elements with calculated centers."""
+        # Pick up any changes made to element_mappings since construction
+        self._index_element_mappings()
+        
         # Results list for all elements
         results = []
         
@@ -942,9 +1004,12 @@ class SVGTransformer:
         total_elements = 0
         processed_elements = 0
         
+        # Collect every element type and the groups in a single walk of the document
+        elements_by_tag = self._get_elements_by_tag([svg_type for svg_type, _ in element_types] + ['g'])
+        
         # Process each type of element that are direct children of the SVG (not in groups)
         for svg_type, plural in element_types:
-            elements = self.doc.getElementsByTagName(svg_type)
+            elements = elements_by_tag[svg_type]
             count = 0
             
             for element in elements:
@@ -963,7 +1028,7 @@ class SVGTransformer:
                 ui_print(f"Processed {count} {plural} (outside groups), successfully converted {count}")
         
         # Process group elements
-        groups = self.doc.getElementsByTagName('g')
+        groups = elements_by_tag['g']
         group_count = 0
         
         for group in groups:
@@ -980,6 +1045,30 @@ class SVGTransformer:
         ui_print(f"Total: Processed {total_elements} SVG elements ({group_count} groups), successfully converted {processed_elements}")
         return results
     
+    def _get_elements_by_tag(self, tag_names):
+        """
+        Collect elements with the given tag names in document order.
+        
+        Equivalent to calling getElementsByTagName for each tag, but walks
+        the document only once.
+        """
+        elements_by_tag = {tag: [] for tag in tag_names}
+        stack = [self.doc.documentElement]
+        
+        while stack:
+            node = stack.pop()
+            if node.nodeType != node.ELEMENT_NODE:
+                continue
+            
+            elements = elements_by_tag.get(node.tagName)
+            if elements is not None:
+                elements.append(node)
+            
+            # Push children in reverse so they are visited in document order
+            stack.extend(reversed(node.childNodes))
+        
+        return elements_by_tag
+    
     def process_group(self, group, group_count):
         """Process a group element and all its children."""
         results = []
@@ -988,77 +1077,62 @@ class SVGTransformer:
         group_id = group.getAttribute('id') or f"group{group_count}"
         group_label = group.getAttribute('inkscape:label') or ""
         
-        ui_print(f"DEBUG: Raw group info: id='{group_id}', label='{group_label}'")
+        logger.debug("Raw group info: id='%s', label='%s'", group_id, group_label)
         
         # Extract group label prefix (if any)
         group_label_prefix = ""
         if group_label and "_" in group_label:
-            group_label_prefix = group_label.split("_")[0]
-            ui_print(f"DEBUG: Group #{group_count} has label with underscore, extracted prefix: '{group_label_prefix}'")
+            group_label_prefix = group_label.split("_", 1)[0]
+            logger.debug("Group #%s has label with underscore, extracted prefix: '%s'", group_count, group_label_prefix)
         # If no prefix from label with underscore, check if the label itself matches a mapping prefix
         elif group_label:
             # Check if the group label itself exists as a label_prefix in mappings
-            ui_print(f"DEBUG: Group #{group_count} has no label with underscore, checking if group label '{group_label}' matches any mapping prefixes")
+            logger.debug("Group #%s has no label with underscore, checking if group label '%s' matches any mapping prefixes", group_count, group_label)
             if 'element_mappings' in self.custom_options:
                 # First try exact match
-                has_exact_match = False
-                for mapping in self.custom_options['element_mappings']:
-                    if mapping.get('label_prefix', '') == group_label:
-                        group_label_prefix = group_label
-                        ui_print(f"DEBUG: Found exact match for group label '{group_label}' as prefix")
-                        has_exact_match = True
-                        break
+                if group_label in self._mapping_by_prefix:
+                    group_label_prefix = group_label
+                    logger.debug("Found exact match for group label '%s' as prefix", group_label)
                 
                 # If no exact match, try case-insensitive match
-                if not has_exact_match:
-                    ui_print(f"DEBUG: No exact match for group label '{group_label}', trying case-insensitive match")
-                    for mapping in self.custom_options['element_mappings']:
-                        # Case-insensitive comparison
-                        ui_print(f"DEBUG: Comparing group label '{group_label.upper()}' with mapping prefix '{mapping.get('label_prefix', '').upper()}'")
-                        if mapping.get('label_prefix', '').upper() == group_label.upper():
-                            group_label_prefix = mapping.get('label_prefix', '')
-                            ui_print(f"DEBUG: Using group label '{group_label}' as prefix '{group_label_prefix}' (matched mapping case-insensitively)")
-                            break
+                else:
+                    logger.debug("No exact match for group label '%s', trying case-insensitive match", group_label)
+                    mapping = self._mapping_by_prefix_ci.get(group_label.upper())
+                    if mapping is not None:
+                        group_label_prefix = mapping.get('label_prefix', '')
+                        logger.debug("Using group label '%s' as prefix '%s' (matched mapping case-insensitively)", group_label, group_label_prefix)
         
         # If still no prefix, try to use the group ID as a fallback
         if not group_label_prefix and group_id:
             # Check if group ID exists as a label_prefix in mappings
-            ui_print(f"DEBUG: Group #{group_count} has no label prefix, checking if group ID '{group_id}' matches any mapping prefixes")
+            logger.debug("Group #%s has no label prefix, checking if group ID '%s' matches any mapping prefixes", group_count, group_id)
             if 'element_mappings' in self.custom_options:
                 # First try exact match
-                has_exact_match = False
-                for mapping in self.custom_options['element_mappings']:
-                    if mapping.get('label_prefix', '') == group_id:
-                        group_label_prefix = group_id
-                        ui_print(f"DEBUG: Found exact match for group ID '{group_id}' as prefix")
-                        has_exact_match = True
-                        break
+                if group_id in self._mapping_by_prefix:
+                    group_label_prefix = group_id
+                    logger.debug("Found exact match for group ID '%s' as prefix", group_id)
                 
                 # If no exact match, try case-insensitive match
-                if not has_exact_match:
-                    ui_print(f"DEBUG: No exact match for group ID '{group_id}', trying case-insensitive match")
-                    for mapping in self.custom_options['element_mappings']:
-                        # Case-insensitive comparison
-                        ui_print(f"DEBUG: Comparing group ID '{group_id.upper()}' with mapping prefix '{mapping.get('label_prefix', '').upper()}'")
-                        if mapping.get('label_prefix', '').upper() == group_id.upper():
-                            group_label_prefix = mapping.get('label_prefix', '')
-                            ui_print(f"DEBUG: Using group ID '{group_id}' as prefix '{group_label_prefix}' (matched mapping case-insensitively)")
-                            break
+                else:
+                    logger.debug("No exact match for group ID '%s', trying case-insensitive match", group_id)
+                    mapping = self._mapping_by_prefix_ci.get(group_id.upper())
+                    if mapping is not None:
+                        group_label_prefix = mapping.get('label_prefix', '')
+                        logger.debug("Using group ID '%s' as prefix '%s' (matched mapping case-insensitively)", group_id, group_label_prefix)
         
         # Extract group suffix (if any)
         group_suffix = None
         if group_label and len(group_label) >= 2:
             last_char = group_label[-1].lower()
-            if last_char in ['r', 'd', 'l', 'u']:
+            if last_char in _SUFFIX_ROTATION:
                 group_suffix = last_char
-                ui_print(f"DEBUG: Group #{group_count} has suffix: '{group_suffix}'")
+                logger.debug("Group #%s has suffix: '%s'", group_count, group_suffix)
         
         # Standard debugging for all groups
-        ui_print(f"PROCESSING GROUP: #{group_count}: id='{group_id}', label='{group_label}', prefix='{group_label_prefix}', suffix='{group_suffix}'")
+        logger.debug("PROCESSING GROUP: #%s: id='%s', label='%s', prefix='%s', suffix='%s'", group_count, group_id, group_label, group_label_prefix, group_suffix)
         
-        # Get all child elements of supported types
-        element_types = ['rect', 'circle', 'ellipse', 'line', 'polyline', 'polygon', 'path']
-        element_count_by_type = {svg_type: 0 for svg_type in element_types}
+        # Per-type counters used to number the group's child elements
+        element_count_by_type = {}
         
         # Process direct children of this group
         for child in group.childNodes:
@@ -1066,15 +1140,16 @@ class SVGTransformer:
                 continue
                 
             svg_type = child.tagName
-            if svg_type in element_types:
+            if svg_type in _SUPPORTED_ELEMENT_TYPES:
                 # Increment count for this type
-                element_count_by_type[svg_type] += 1
-                count = element_count_by_type[svg_type]
+                count = element_count_by_type.get(svg_type, 0) + 1
+                element_count_by_type[svg_type] = count
                 
                 # Get element details for debugging
-                element_id = child.getAttribute('id') or ""
-                element_label = child.getAttribute('inkscape:label') or element_id
-                ui_print(f"DEBUG: Processing element in group '{group_id}': id='{element_id}', label='{element_label}', type='{svg_type}'")
+                if self.debug:
+                    element_id = child.getAttribute('id') or ""
+                    element_label = child.getAttribute('inkscape:label') or element_id
+                    logger.debug("Processing element in group '%s': id='%s', label='%s', type='%s'", group_id, element_id, element_label, svg_type)
                 
                 # Process the element
                 element_json = self.process_element_with_group_context(
@@ -1087,9 +1162,10 @@ class SVGTransformer:
                 
                 if element_json:
                     results.append(element_json)
-                    ui_print(f"DEBUG: Element '{element_label}' final processing result: props_path='{element_json['props']['path']}', elementPrefix='{element_json['meta'].get('elementPrefix')}'")
-                else:
-                    ui_print(f"DEBUG: Element '{element_label}' processing failed, no JSON returned")
+                    if self.debug:
+                        logger.debug("Element '%s' final processing result: props_path='%s', elementPrefix='%s'", element_label, element_json['props']['path'], element_json['meta'].get('elementPrefix'))
+                elif self.debug:
+                    logger.debug("Element '%s' processing failed, no JSON returned", element_label)
         
         return results
     
@@ -1100,79 +1176,78 @@ class SVGTransformer:
             element_id = element.getAttribute('id') or ""
             element_label = element.getAttribute('inkscape:label') or element_id  # Use ID as fallback for label
             
-            ui_print(f"GROUP CONTEXT PROCESSING: element '{element_label}' (type={svg_type}) with group_prefix='{group_label_prefix}'")
+            logger.debug("GROUP CONTEXT PROCESSING: element '%s' (type=%s) with group_prefix='%s'", element_label, svg_type, group_label_prefix)
             
             # Check if the element has its own suffix
             has_own_suffix = False
             if element_label and len(element_label) >= 2:
                 last_char = element_label[-1].lower()
-                if last_char in ['r', 'd', 'l', 'u']:
+                if last_char in _SUFFIX_ROTATION:
                     has_own_suffix = True
-                    ui_print(f"DEBUG: Element '{element_label}' has its own suffix: '{last_char}'")
+                    logger.debug("Element '%s' has its own suffix: '%s'", element_label, last_char)
             
             # Check if the element has its own prefix
             has_own_prefix = False
             element_prefix = ""
             if element_label and "_" in element_label:
-                candidate_prefix = element_label.split("_")[0]
-                ui_print(f"DEBUG: Element '{element_label}' has underscore, candidate prefix: '{candidate_prefix}'")
+                candidate_prefix = element_label.split("_", 1)[0]
+                logger.debug("Element '%s' has underscore, candidate prefix: '%s'", element_label, candidate_prefix)
                 
                 # Only treat it as a prefix if it exists in the mappings
                 if 'element_mappings' in self.custom_options and candidate_prefix:
-                    ui_print(f"DEBUG: Checking if candidate prefix '{candidate_prefix}' exists in mappings")
-                    prefix_exists = False
-                    for mapping in self.custom_options['element_mappings']:
-                        # Case-insensitive comparison
-                        ui_print(f"DEBUG: Comparing '{candidate_prefix.upper()}' with '{mapping.get('label_prefix', '').upper()}'")
-                        if mapping.get('label_prefix', '').upper() == candidate_prefix.upper():
-                            prefix_exists = True
-                            # Use the prefix as defined in the mapping (preserve case from mapping)
-                            element_prefix = mapping.get('label_prefix', '')
-                            ui_print(f"DEBUG: Found valid prefix match: '{element_prefix}' for candidate '{candidate_prefix}'")
-                            break
+                    logger.debug("Checking if candidate prefix '%s' exists in mappings", candidate_prefix)
+                    # Case-insensitive lookup
+                    mapping = self._mapping_by_prefix_ci.get(candidate_prefix.upper())
+                    prefix_exists = mapping is not None
+                    if prefix_exists:
+                        # Use the prefix as defined in the mapping (preserve case from mapping)
+                        element_prefix = mapping.get('label_prefix', '')
+                        logger.debug("Found valid prefix match: '%s' for candidate '%s'", element_prefix, candidate_prefix)
                     
                     # Only use the prefix if it's defined in the mappings
                     if prefix_exists:
                         has_own_prefix = True
-                        ui_print(f"DEBUG: Element '{element_label}' has valid own prefix: '{element_prefix}'")
+                        logger.debug("Element '%s' has valid own prefix: '%s'", element_label, element_prefix)
                     else:
-                        ui_print(f"DEBUG: Extracted prefix '{candidate_prefix}' not found in mappings, treating as no prefix")
+                        logger.debug("Extracted prefix '%s' not found in mappings, treating as no prefix", candidate_prefix)
             
             # Important priority decision: If element has no valid prefix but is in a group with prefix,
             # use the group's prefix for processing
             if not has_own_prefix and group_label_prefix:
-                ui_print(f"DEBUG: Element '{element_label}' has no valid prefix but is in group with prefix '{group_label_prefix}' - using group prefix")
+                logger.debug("Element '%s' has no valid prefix but is in group with prefix '%s' - using group prefix", element_label, group_label_prefix)
                 
                 # Process the element with the group's prefix
                 element_json = self.process_element_with_forced_prefix(element, element_count, svg_type, group_label_prefix)
                 
                 # Add indicator for debugging
                 if element_json:
-                    element_json['meta']['inheritedGroupPrefix'] = group_label_prefix
-                    ui_print(f"INHERITED PREFIX: Applied group prefix '{group_label_prefix}' to element {element_json['meta']['name']}")
-                    ui_print(f"DEBUG: Element JSON after forced prefix: props_path='{element_json['props']['path']}', meta={element_json['meta']}")
+                    meta = element_json['meta']
+                    meta['inheritedGroupPrefix'] = group_label_prefix
+                    if self.debug:
+                        logger.debug("INHERITED PREFIX: Applied group prefix '%s' to element %s", group_label_prefix, meta['name'])
+                        logger.debug("Element JSON after forced prefix: props_path='%s', meta=%s", element_json['props']['path'], meta)
                     
                     # Apply group suffix if applicable
                     if group_suffix and not has_own_suffix:
                         self.apply_group_suffix(element_json, group_suffix)
-                        ui_print(f"DEBUG: Applied group suffix '{group_suffix}' to element {element_json['meta']['name']}")
+                        logger.debug("Applied group suffix '%s' to element %s", group_suffix, element_json['meta']['name'])
                     
                     return element_json
                 else:
-                    ui_print(f"DEBUG: Failed to process element '{element_label}' with forced prefix '{group_label_prefix}'")
+                    logger.debug("Failed to process element '%s' with forced prefix '%s'", element_label, group_label_prefix)
                     return None
             
             # If element has its own valid prefix or no group prefix exists, process normally
-            ui_print(f"DEBUG: Element '{element_label}' using standard processing (has_own_prefix={has_own_prefix}, group_prefix='{group_label_prefix}')")
+            logger.debug("Element '%s' using standard processing (has_own_prefix=%s, group_prefix='%s')", element_label, has_own_prefix, group_label_prefix)
             element_json = self.process_element(element, element_count, svg_type)
             if not element_json:
-                ui_print(f"DEBUG: Failed to process element '{element_label}' with standard processing")
+                logger.debug("Failed to process element '%s' with standard processing", element_label)
                 return None
             
             # For elements with their own prefix but no suffix, apply group suffix if available
             if group_suffix and not has_own_suffix:
                 self.apply_group_suffix(element_json, group_suffix)
-                ui_print(f"DEBUG: Applied group suffix '{group_suffix}' to element with own prefix {element_json['meta']['name']}")
+                logger.debug("Applied group suffix '%s' to element with own prefix %s", group_suffix, element_json['meta']['name'])
             
             return element_json
             
@@ -1191,7 +1266,7 @@ class SVGTransformer:
             element_name = element_label or f"{svg_type}{element_count}"
             original_name = element_name
             
-            ui_print(f"FORCED PREFIX PROCESSING: element '{element_name}' with forced_prefix='{forced_prefix}'")
+            logger.debug("FORCED PREFIX PROCESSING: element '%s' with forced_prefix='%s'", element_name, forced_prefix)
             
             # CRITICAL CHANGE: Instead of using process_element and then overriding,
             # we'll directly create the element JSON with the forced prefix
@@ -1204,25 +1279,20 @@ class SVGTransformer:
             
             # Find the mapping for this forced prefix directly
             # Use case-insensitive comparison for the prefix
-            ui_print(f"DEBUG: Searching for mapping with svg_type='{svg_type}' and label_prefix='{forced_prefix}' (case-insensitive)")
-            mapping = None
-            
+            logger.debug("Searching for mapping with svg_type='%s' and label_prefix='%s' (case-insensitive)", svg_type, forced_prefix)
             # Debug: Print all available mappings for this SVG type for comparison
-            ui_print(f"DEBUG: Available mappings for svg_type='{svg_type}':")
-            for i, m in enumerate(self.custom_options.get('element_mappings', [])):
-                if m.get('svg_type', '') == svg_type:
-                    ui_print(f"DEBUG: Mapping #{i+1}: label_prefix='{m.get('label_prefix', '')}', props_path='{m.get('props_path', '')}'")
-            
-            for m in self.custom_options.get('element_mappings', []):
-                if (m.get('svg_type', '') == svg_type):
-                    ui_print(f"DEBUG: Comparing mapping prefix '{m.get('label_prefix', '')}' ({m.get('label_prefix', '').upper()}) with forced prefix '{forced_prefix}' ({forced_prefix.upper()})")
-                    if m.get('label_prefix', '').upper() == forced_prefix.upper():
-                        mapping = m
-                        ui_print(f"DEBUG: FOUND MAPPING with matching prefix: svg_type='{m.get('svg_type')}', label_prefix='{m.get('label_prefix')}', props_path='{m.get('props_path')}'")
-                        break
+            if self.debug:
+                logger.debug("Available mappings for svg_type='%s':", svg_type)
+                for i, m in enumerate(self.custom_options.get('element_mappings', [])):
+                    if m.get('svg_type', '') == svg_type:
+                        logger.debug("Mapping #%s: label_prefix='%s', props_path='%s'", i+1, m.get('label_prefix', ''), m.get('props_path', ''))
+            
+            mapping = self._mapping_by_type_and_prefix_ci.get((svg_type, forced_prefix.upper()))
+            if mapping is not None:
+                logger.debug("FOUND MAPPING with matching prefix: svg_type='%s', label_prefix='%s', props_path='%s'", mapping.get('svg_type'), mapping.get('label_prefix'), mapping.get('props_path'))
             
             if mapping:
-                ui_print(f"DEBUG: Using mapping with props_path='{mapping.get('props_path')}', width={mapping.get('width')}, height={mapping.get('height')}")
+                logger.debug("Using mapping with props_path='%s', width=%s, height=%s", mapping.get('props_path'), mapping.get('width'), mapping.get('height'))
                 
                 # Get dimensions from the mapping
                 element_width = mapping.get('width', self.custom_options.get('width', 10))
@@ -1244,17 +1314,10 @@ class SVGTransformer:
                 suffix = None
                 if element_name and len(element_name) >= 2:
                     last_char = element_name[-1].lower()
-                    if last_char in ['r', 'd', 'l', 'u']:
+                    if last_char in _SUFFIX_ROTATION:
                         suffix = last_char
                         # Override rotation based on suffix
-                        if last_char == 'r':
-                            rotation_angle = 0
-                        elif last_char == 'd':
-                            rotation_angle = 90
-                        elif last_char == 'l':
-                            rotation_angle = 180
-                        elif last_char == 'u':
-                            rotation_angle = 270
+                        rotation_angle = _SUFFIX_ROTATION[last_char]
                 
                 # Clean the element name
                 has_prefix_mapping = True  # We know the mapping exists since we found it
@@ -1266,10 +1329,10 @@ class SVGTransformer:
                     mapping
                 )
                 
-                ui_print(f"DEBUG: After name cleaning: '{element_name}' -> '{cleaned_name}'")
+                logger.debug("After name cleaning: '%s' -> '%s'", element_name, cleaned_name)
                 
                 # Create the element JSON directly with the forced prefix
-                ui_print(f"DEBUG: Creating element JSON with label_prefix='{mapping.get('label_prefix', '')}'")
+                logger.debug("Creating element JSON with label_prefix='%s'", mapping.get('label_prefix', ''))
                 element_json = self.create_element_json(
                     element_name=cleaned_name,
                     element_id=element_id,
@@ -1296,19 +1359,21 @@ class SVGTransformer:
                 # CRITICAL: Ensure the elementPrefix is set to the actual prefix from the mapping
                 element_json['meta']['elementPrefix'] = mapping.get('label_prefix', '')
                 
-                ui_print(f"FORCED PREFIX RESULT: element '{element_name}' -> '{cleaned_name}'")
-                ui_print(f"  → Using props path: {element_json['props']['path']}")
-                ui_print(f"  → Element prefix set to: {element_json['meta']['elementPrefix']}")
-                ui_print(f"  → Element dimensions: {element_width}x{element_height}")
+                if self.debug:
+                    logger.debug("FORCED PREFIX RESULT: element '%s' -> '%s'", element_name, cleaned_name)
+                    logger.debug("  → Using props path: %s", element_json['props']['path'])
+                    logger.debug("  → Element prefix set to: %s", element_json['meta']['elementPrefix'])
+                    logger.debug("  → Element dimensions: %sx%s", element_width, element_height)
                 
                 return element_json
             else:
                 # If no mapping found for the forced prefix, fall back to regular processing
                 # but log a warning
                 ui_print(f"WARNING: No mapping found for svg_type={svg_type}, forced_prefix='{forced_prefix}' (case-insensitive). Using default processing.")
-                ui_print(f"DEBUG: Available mappings in custom_options: {len(self.custom_options.get('element_mappings', []))}")
-                for i, m in enumerate(self.custom_options.get('element_mappings', [])):
-                    ui_print(f"DEBUG: Mapping #{i+1}: svg_type='{m.get('svg_type', '')}', label_prefix='{m.get('label_prefix', '')}'")
+                if self.debug:
+                    logger.debug("Available mappings in custom_options: %s", len(self.custom_options.get('element_mappings', [])))
+                    for i, m in enumerate(self.custom_options.get('element_mappings', [])):
+                        logger.debug("Mapping #%s: svg_type='%s', label_prefix='%s'", i+1, m.get('svg_type', ''), m.get('label_prefix', ''))
                 
                 return self.process_element(element, element_count, svg_type)
             
@@ -1374,12 +1439,14 @@ class SVGTransformer:
                     # Extract the first x,y coordinates from the path data
                     # Path data typically starts with "m" or "M" followed by x,y coordinates
                     # Try to match coordinates with comma separator (most common)
-                    comma_separated = re.findall(r'[mM]\s*([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s*,\s*([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)', d_attr)
+                    # Only the first match is used, so stop scanning the path data there
+                    comma_match = _PATH_MOVE_COMMA_RE.search(d_attr)
+                    comma_separated = [comma_match.groups()] if comma_match else []
                     
                     # If not found, try to match coordinates with space separator
                     space_separated = []
                     if not comma_separated:
-                        space_match = re.search(r'[mM]\s*([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s+([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)', d_attr)
+                        space_match = _PATH_MOVE_SPACE_RE.search(d_attr)
                         if space_match:
                             space_separated = [(space_match.group(1), space_match.group(2))]
                     
@@ -1420,42 +1487,41 @@ class SVGTransformer:
         if not element_json or not group_suffix:
             return
             
-        # Get original rotation
-        original_rotation = element_json['position'].get('rotate', {}).get('angle', '0deg')
+        position = element_json['position']
+        meta = element_json['meta']
         
-        # Parse the original rotation
-        try:
-            orig_rotation_angle = float(original_rotation.replace('deg', ''))
-        except (ValueError, AttributeError):
-            orig_rotation_angle = 0
+        # Original rotation, only needed for unknown suffixes and debug output
+        original_rotation = None
+        if self.debug or group_suffix not in _SUFFIX_ROTATION:
+            original_rotation = position.get('rotate', {}).get('angle', '0deg')
         
         # Calculate new rotation based on group suffix
-        new_rotation = orig_rotation_angle
-        if group_suffix == 'r':
-            new_rotation = 0
-        elif group_suffix == 'd':
-            new_rotation = 90
-        elif group_suffix == 'l':
-            new_rotation = 180
-        elif group_suffix == 'u':
-            new_rotation = 270
+        new_rotation = _SUFFIX_ROTATION.get(group_suffix)
+        if new_rotation is None:
+            # Unknown suffix, keep the original rotation
+            try:
+                new_rotation = float(original_rotation.replace('deg', ''))
+            except (ValueError, AttributeError):
+                new_rotation = 0
         
         # Update the rotation in the element JSON
-        if 'rotate' not in element_json['position']:
-            element_json['position']['rotate'] = {'anchor': '50% 50%'}
+        rotate = position.get('rotate')
+        if rotate is None:
+            rotate = position['rotate'] = {'anchor': '50% 50%'}
             
-        element_json['position']['rotate']['angle'] = f"{new_rotation}deg"
+        rotate['angle'] = f"{new_rotation}deg"
         
-        logger.debug(f"Applied group suffix '{group_suffix}' to element {element_json['meta']['name']}, rotation: {original_rotation} → {new_rotation}deg")
+        if self.debug:
+            logger.debug("Applied group suffix '%s' to element %s, rotation: %s → %sdeg", group_suffix, meta['name'], original_rotation, new_rotation)
         
         # Add suffix to metadata
-        element_json['meta']['groupSuffix'] = group_suffix
+        meta['groupSuffix'] = group_suffix
 
 def save_json_to_file(data, output_file):
     """Save data to a JSON file."""
     try:
         with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            f.write(json.dumps(data, indent=2))
         logger.info(f"Elements saved to {output_file}")
         ui_print(f"Elements saved to {output_file}")
         return True
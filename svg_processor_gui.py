@@ -29,7 +29,6 @@ import tempfile
 from datetime import datetime
 from contextlib import redirect_stdout
 from inkscape_transform import SVGTransformer
-from PIL import Image, ImageTk  # For handling images
 import re
 import threading
 import queue
@@ -93,6 +92,13 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Window icon files, in order of preference
+ICON_FILES = (
+    "autStand_ic0n.ico",
+    "autstand_icon.ico",
+    "automation_standard_logo.jpg"
+)
+
 class ConfigManager:
     """
     Configuration Manager class for handling configuration persistence.
@@ -193,13 +199,39 @@ class ConfigManager:
             bool: True if the configuration was saved successfully, False otherwise.
         """
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
+            self._write_config_file(config)
             print(f"Configuration saved to: {self.config_file}")
             return True
         except Exception as e:
             print(f"Error saving configuration: {e}")
             return False
+    
+    def _write_config_file(self, config):
+        """
+        Atomically replace the configuration file with the given config.
+        
+        The config is written to a temporary file next to the target, flushed
+        to disk and then moved over the original with os.replace, so a crash
+        mid-save never leaves a truncated config.json behind.
+        
+        Args:
+            config (dict): The configuration dictionary to write.
+            
+        Raises:
+            Exception: If the file cannot be written or replaced.
+        """
+        temp_file = f"{self.config_file}.tmp"
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump(config, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.config_file)
+        except Exception:
+            # Don't leave a stale temporary file behind
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
             
     def _ensure_backward_compatibility(self, config):
         """Ensure backward compatibility with older config formats."""
@@ -399,8 +431,7 @@ class ConfigManager:
     def save(self, config):
         """Save configuration to file."""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
+            self._write_config_file(config)
             print(f"Configuration saved to: {self.config_file}")
             return True
         except Exception as e:
@@ -519,6 +550,12 @@ class SVGProcessorApp:
         # Store the processed elements
         self.elements = []
         
+        # (elements, formatted JSON) of the last serialized result set
+        self._elements_json_cache = None
+        
+        # Encoded thumbnail.png bytes, rendered on first export
+        self._thumbnail_png = None
+        
         # Create a queue for thread communication
         self.queue = queue.Queue()
         
@@ -1055,21 +1092,12 @@ class SVGProcessorApp:
         Returns:
             str: The path to the icon file, or None if not found.
         """
-        # Try icon files in order of preference
-        icon_files = [
-            "autStand_ic0n.ico",
-            "autstand_icon.ico",
-            "automation_standard_logo.jpg"
-        ]
-        
-        # Check each file
-        for icon_file in icon_files:
-            try:
-                path = resource_path(icon_file)
-                if os.path.exists(path):
-                    return path
-            except Exception:
-                continue
+        # Check each candidate in order of preference; resource_path handles
+        # its own lookup errors, so no per-candidate exception handling is needed
+        for icon_file in ICON_FILES:
+            path = resource_path(icon_file)
+            if os.path.exists(path):
+                return path
                 
         return None
     
@@ -1107,6 +1135,7 @@ class SVGProcessorApp:
         """
         try:
             print(f"Creating PhotoImage from: {icon_path}")
+            from PIL import Image, ImageTk
             icon_img = Image.open(icon_path)
             
             # Set the default icon
@@ -1129,6 +1158,7 @@ class SVGProcessorApp:
         try:
             print(f"Creating image icon from: {image_path}")
             # Convert image to PhotoImage for icon
+            from PIL import Image, ImageTk
             icon_img = Image.open(image_path)
             # Resize to standard icon size
             icon_img = icon_img.resize((32, 32), Image.LANCZOS)
@@ -1645,7 +1675,7 @@ class SVGProcessorApp:
             
         try:
             # Format results with indentation for better readability
-            formatted_json = json.dumps(elements, indent=2)
+            formatted_json = self._format_elements_json(elements)
             
             # For large results, insert in chunks to prevent UI freezing
             if len(formatted_json) > 50000:  # Large result threshold
@@ -1661,6 +1691,27 @@ class SVGProcessorApp:
             self.results_text.insert(tk.END, f"Error formatting results: {str(e)}")
             self.status_var.set("Error displaying results.")
     
+    def _format_elements_json(self, elements):
+        """
+        Serialize elements as indented JSON, reusing the previous result.
+        
+        The same result set is displayed, copied and saved, so it is only
+        serialized once per processing run.
+        
+        Args:
+            elements (list): The processed SVG elements.
+            
+        Returns:
+            str: The elements formatted as indented JSON.
+        """
+        cached = self._elements_json_cache
+        if cached is not None and cached[0] is elements:
+            return cached[1]
+        
+        formatted_json = json.dumps(elements, indent=2)
+        self._elements_json_cache = (elements, formatted_json)
+        return formatted_json
+    
     def _insert_large_text(self, text_widget, text):
         """Insert large text in chunks to prevent UI freezing."""
         chunk_size = 10000  # Characters per chunk
@@ -1691,7 +1742,7 @@ class SVGProcessorApp:
         try:
             # Clear clipboard and append new content
             self.root.clipboard_clear()
-            self.root.clipboard_append(json.dumps(self.elements, indent=2))
+            self.root.clipboard_append(self._format_elements_json(self.elements))
             
             self.status_var.set("Results copied to clipboard!")
             
@@ -1741,7 +1792,7 @@ class SVGProcessorApp:
             
             if filename:
                 with open(filename, 'w') as f:
-                    json.dump(self.elements, f, indent=2)
+                    f.write(self._format_elements_json(self.elements))
                 self.status_var.set(f"Results saved to {os.path.basename(filename)}")
                 messagebox.showinfo("Success", f"Results have been saved to {filename}")
         except PermissionError:
@@ -1755,6 +1806,7 @@ class SVGProcessorApp:
         """Clear the results area."""
         self.results_text.delete(1.0, tk.END)
         self.elements = []
+        self._elements_json_cache = None
         self.status_var.set("Results cleared.")
         
         # Also clear the log text if it's getting too large
@@ -1825,13 +1877,14 @@ class SVGProcessorApp:
             messagebox.showinfo("Processing", "Please wait for SVG processing to complete before exporting.")
             return
             
-        # Debug: Print elements before export
-        print("DEBUG: Elements before export:")
+        # Debug: Print elements before export, collected and written in one call
+        debug_lines = ["DEBUG: Elements before export:"]
         for i, element in enumerate(self.elements):
-            print(f"DEBUG: Element {i}: {element.get('meta', {}).get('name', 'unknown')}")
+            debug_lines.append(f"DEBUG: Element {i}: {element.get('meta', {}).get('name', 'unknown')}")
             # Print position info to check for height
             pos = element.get('position', {})
-            print(f"DEBUG: Position: x={pos.get('x')}, y={pos.get('y')}, width={pos.get('width')}, height={pos.get('height')}")
+            debug_lines.append(f"DEBUG: Position: x={pos.get('x')}, y={pos.get('y')}, width={pos.get('width')}, height={pos.get('height')}")
+        print("\n".join(debug_lines))
             
         # Validate SCADA project settings
         if not self._validate_scada_settings():
@@ -2100,7 +2153,7 @@ class SVGProcessorApp:
         
         project_file = os.path.join(project_dir, "project.json")
         with open(project_file, 'w') as f:
-            json.dump(project_config, f, indent=2)
+            f.write(json.dumps(project_config, indent=2))
     
     def _create_resource_json(self, view_dir):
         """
@@ -2136,7 +2189,7 @@ class SVGProcessorApp:
         
         resource_file = os.path.join(view_dir, "resource.json")
         with open(resource_file, 'w') as f:
-            json.dump(resource_config, f, indent=2)
+            f.write(json.dumps(resource_config, indent=2))
     
     def _create_thumbnail(self, view_dir):
         """
@@ -2152,9 +2205,18 @@ class SVGProcessorApp:
         if hasattr(view_dir, '__class__') and view_dir.__class__.__name__ == 'MagicMock':
             raise ValueError("Cannot create thumbnail.png with mock directory path")
         
+        # The thumbnail is always the same blank image, so encode it once
+        # and write the cached bytes on later exports
+        if self._thumbnail_png is None:
+            from PIL import Image
+            empty_image = Image.new('RGBA', (950, 530), (240, 240, 240, 0))
+            png_buffer = io.BytesIO()
+            empty_image.save(png_buffer, format='PNG')
+            self._thumbnail_png = png_buffer.getvalue()
+        
         thumbnail_file = os.path.join(view_dir, "thumbnail.png")
-        empty_image = Image.new('RGBA', (950, 530), (240, 240, 240, 0))
-        empty_image.save(thumbnail_file)
+        with open(thumbnail_file, 'wb') as f:
+            f.write(self._thumbnail_png)
     
     def _create_view_json(self, view_dir):
         """
@@ -2270,44 +2332,35 @@ class SVGProcessorApp:
         # Process all elements to SCADA format
         scada_elements = []
         
+        # Per-element debug output is collected and printed once after the loop
+        debug_lines = []
+        
         # Completely rebuild each element from scratch avoiding any dependency on the original structure
         for i, element in enumerate(self.elements):
             try:
-                print(f"DEBUG: Creating SCADA element {i}")
+                debug_lines.append(f"DEBUG: Creating SCADA element {i}")
                 
                 # Extract element name from meta
                 meta = element.get('meta', {})
                 element_name = meta.get('name', f"element{i}")
-                print(f"DEBUG: Element name: {element_name}")
+                debug_lines.append(f"DEBUG: Element name: {element_name}")
                 
                 # Extract position information
                 position = element.get('position', {})
                 
-                # Initialize position values
-                x = 0
-                y = 0
-                width = 14
-                height = 14
-                rotation = None
-                
-                # Get position values from different possible locations
-                if 'translate' in position:
-                    translate = position.get('translate', {})
-                    x = translate.get('x', 0)
-                    y = translate.get('y', 0)
-                else:
-                    x = position.get('x', 0)
-                    y = position.get('y', 0)
-                
-                if 'size' in position:
-                    size = position.get('size', {})
-                    width = size.get('width', 14)
-                    height = size.get('height', 14)
-                else:
-                    width = position.get('width', 14)
-                    height = position.get('height', 14)
+                # Position values are either flat or nested under translate/size;
+                # pick the source dicts once and build the position in one literal
+                translate = position.get('translate', position)
+                size = position.get('size', position)
+                scada_position = {
+                    "x": translate.get('x', 0),
+                    "y": translate.get('y', 0),
+                    "width": size.get('width', 14),
+                    "height": size.get('height', 14)
+                }
                 
                 # Get rotation if available
+                rotation = None
                 if 'rotate' in position:
                     rotation = position.get('rotate', {})
                 elif 'rotation' in element:
@@ -2339,39 +2392,38 @@ class SVGProcessorApp:
                     "meta": {
                         "name": element_name
                     },
-                    "position": {
-                        "x": x,
-                        "y": y,
-                        "width": width,
-                        "height": height
-                    },
+                    "position": scada_position,
                     "custom": {}
                 }
                 
                 # Add rotation if it was found
                 if rotation:
-                    scada_element["position"]["rotate"] = rotation
+                    scada_position["rotate"] = rotation
                 
                 # Add the element to our list
                 scada_elements.append(scada_element)
-                print(f"DEBUG: Successfully created element {i}")
+                debug_lines.append(f"DEBUG: Successfully created element {i}")
                 
             except Exception as e:
-                print(f"DEBUG: Error creating SCADA element {i}: {e}")
+                debug_lines.append(f"DEBUG: Error creating SCADA element {i}: {e}")
+        
+        if debug_lines:
+            print("\n".join(debug_lines))
         
         # Add all processed elements to the root children
-        for element in scada_elements:
-            view_config["root"]["children"].append(element)
+        view_config["root"]["children"].extend(scada_elements)
         
         # Print final summary
         print(f"DEBUG: Total elements added to root: {len(scada_elements)}")
         print(f"DEBUG: Total items in root.children: {len(view_config['root']['children'])}")
         
         # Write the view.json file
+        # Serialize in one pass and write once; json.dump with indent issues
+        # a separate write() for every token, which is slow for large views.
         view_file = os.path.join(view_dir, "view.json")
         try:
             with open(view_file, 'w') as f:
-                json.dump(view_config, f, indent=2)
+                f.write(json.dumps(view_config, indent=2))
             print(f"DEBUG: Successfully wrote view.json to {view_file}")
         except Exception as e:
             print(f"DEBUG: Error writing view.json: {e}")
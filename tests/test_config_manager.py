@@ -122,6 +122,22 @@ class TestConfigManager(unittest.TestCase):
         self.assertEqual(loaded_config.get('element_width'), '20')
         self.assertEqual(loaded_config.get('element_height'), '30')
     
+    def test_save_config_is_atomic(self):
+        """Test that saving replaces the config file without leaving temp files."""
+        config_manager = ConfigManager(self.config_path)
+        
+        # Save twice to exercise replacing an existing file
+        self.assertTrue(config_manager.save_config({'test_key': 'first'}))
+        self.assertTrue(config_manager.save_config({'test_key': 'second'}))
+        
+        # Verify the latest config was written
+        with open(self.config_path, 'r') as f:
+            loaded_config = json.load(f)
+        self.assertEqual(loaded_config, {'test_key': 'second'})
+        
+        # Verify no temporary file was left behind
+        self.assertEqual(os.listdir(self.temp_dir), [os.path.basename(self.config_path)])
+    
     def test_get_config(self):
         """Test retrieving the configuration."""
         # Create a test configuration
@@ -13,7 +13,7 @@ import copy
 
 # Import the SVGTransformer class
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from inkscape_transform import SVGTransformer, save_json_to_file, validate_with_existing, main
+from inkscape_transform import SVGTransformer, save_json_to_file, validate_with_existing, main, _affine_to_matrix
 
 class TestSVGTransformer(unittest.TestCase):
     """Test the SVGTransformer class for converting SVG files."""
@@ -137,12 +137,32 @@ class TestSVGTransformer(unittest.TestCase):
         expected = np.array([[1, 3, 5], [2, 4, 6], [0, 0, 1]])
         np.testing.assert_array_equal(matrix, expected)
         
+        # Test whitespace-separated matrix transform
+        matrix = self.svg_transformer.parse_transform(" matrix(1 2 3 4 5 6) ")
+        np.testing.assert_array_equal(matrix, expected)
+        
+        # Test matrix transform chained with another operation
+        matrix = self.svg_transformer.parse_transform("matrix(1,0,0,1,5,6) scale(2)")
+        expected = np.array([[2, 0, 5], [0, 2, 6], [0, 0, 1]])
+        np.testing.assert_array_equal(matrix, expected)
+        
         # Test translate transform
         transform = "translate(10,20)"
         matrix = self.svg_transformer.parse_transform(transform)
         expected = np.array([[1, 0, 10], [0, 1, 20], [0, 0, 1]])
         np.testing.assert_array_equal(matrix, expected)
         
+        # Test compact parameters without separators between numbers
+        matrix = self.svg_transformer.parse_transform("translate(10-20)")
+        expected = np.array([[1, 0, 10], [0, 1, -20], [0, 0, 1]])
+        np.testing.assert_array_equal(matrix, expected)
+        
+        # Test that non-numeric tokens float() would accept are not parsed
+        matrix = self.svg_transformer.parse_transform("translate(nan,5) scale(inf)")
+        self.assertTrue(np.all(np.isfinite(matrix)))
+        matrix = self.svg_transformer.parse_transform("matrix(1,0,0,1,inf,nan)")
+        self.assertTrue(np.all(np.isfinite(matrix)))
+        
         # Test scale transform
         transform = "scale(2,3)"
         matrix = self.svg_transformer.parse_transform(transform)
@@ -195,6 +215,53 @@ class TestSVGTransformer(unittest.TestCase):
         self.assertIsInstance(transform, np.ndarray)
         self.assertEqual(transform.shape, (3, 3))  # Should be a 3x3 matrix
     
+    def test_get_all_transforms_reuses_group_transforms(self):
+        """Test that group transforms are parsed once and shared by siblings."""
+        svg_path = os.path.join(self.temp_dir, "grouped.svg")
+        with open(svg_path, 'w') as f:
+            f.write('''<svg width="800" height="600" xmlns="http://www.w3.org/2000/svg">
+                <g transform="translate(10,20)">
+                    <g transform="scale(2)">
+                        <rect id="a" x="0" y="0" width="10" height="10" />
+                        <rect id="b" x="5" y="5" width="10" height="10" transform="translate(1,1)" />
+                    </g>
+                </g>
+            </svg>''')
+        transformer = SVGTransformer(svg_path)
+        rect_a, rect_b = transformer.doc.getElementsByTagName('rect')
+        
+        with patch.object(transformer, '_parse_affine', wraps=transformer._parse_affine) as mock_parse:
+            matrix_a = transformer.get_all_transforms(rect_a)
+            matrix_b = transformer.get_all_transforms(rect_b)
+            
+            # Two group transforms plus rect b's own transform
+            self.assertEqual(mock_parse.call_count, 3)
+            
+            # Repeated lookups only reparse the element's own transform
+            np.testing.assert_array_equal(transformer.get_all_transforms(rect_a), matrix_a)
+            np.testing.assert_array_equal(transformer.get_all_transforms(rect_b), matrix_b)
+            self.assertEqual(mock_parse.call_count, 4)
+    
+    def test_get_elements_by_tag_matches_dom_lookup(self):
+        """Test that the single-walk element lookup matches getElementsByTagName."""
+        svg_path = os.path.join(self.temp_dir, "nested.svg")
+        with open(svg_path, 'w') as f:
+            f.write('''<svg width="800" height="600" xmlns="http://www.w3.org/2000/svg">
+                <rect id="r1" x="0" y="0" width="10" height="10" />
+                <g id="g1">
+                    <circle id="c1" cx="5" cy="5" r="2" />
+                    <g id="g2"><rect id="r2" x="1" y="1" width="2" height="2" /></g>
+                    <a><rect id="r3" x="3" y="3" width="2" height="2" /></a>
+                </g>
+                <circle id="c2" cx="7" cy="7" r="1" />
+            </svg>''')
+        transformer = SVGTransformer(svg_path)
+        
+        elements_by_tag = transformer._get_elements_by_tag(['rect', 'circle', 'g'])
+        
+        for tag in ('rect', 'circle', 'g'):
+            self.assertEqual(elements_by_tag[tag], list(transformer.doc.getElementsByTagName(tag)))
+    
     def test_process_svg(self):
         """Test process_svg method."""
         # Use the default custom options already set up in setUp
@@ -406,6 +473,24 @@ class TestSVGTransformer(unittest.TestCase):
         self.assertEqual(elements[0]['type'], 'ia.display.path')
         self.assertEqual(elements[0]['meta']['name'], 'path1')
         
+    def test_get_element_geometry_path_start(self):
+        """Test reading the first moveto coordinates with either separator."""
+        doc = minidom.parseString(
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            '<path d="M 10,20 L 90,90" /><path d=" m12.5 -3e1 l 5,5" />'
+            '<path d="M 10 20 L 30 40 M 50,60" /></svg>')
+        comma_path, space_path, mixed_path = doc.getElementsByTagName('path')
+        
+        geometry = self.svg_transformer.get_element_geometry(comma_path, 'path')
+        self.assertEqual((geometry['center_x'], geometry['center_y']), (10.0, 20.0))
+        
+        geometry = self.svg_transformer.get_element_geometry(space_path, 'path')
+        self.assertEqual((geometry['center_x'], geometry['center_y']), (12.5, -30.0))
+        
+        # A comma-separated moveto anywhere in the data takes precedence
+        geometry = self.svg_transformer.get_element_geometry(mixed_path, 'path')
+        self.assertEqual((geometry['center_x'], geometry['center_y']), (50.0, 60.0))
+        
     def test_process_polyline_element(self):
         """Test processing of 'polyline' element type."""
         # Create a test SVG with a polyline element
@@ -473,16 +558,13 @@ class TestSVGTransformer(unittest.TestCase):
         # Remove this full test since we've split it into two separate tests
         pass
     
-    def test_handle_rotation_origin(self):
+    def test_rotation_affine_origin(self):
         """Test rotation transformation around origin."""
         transformer = SVGTransformer(self.test_svg_path, self.default_custom_options)
         
-        # Start with identity matrix
-        identity_matrix = np.identity(3)
-        
         # Test rotation around origin (90 degrees)
         angle_deg = 90
-        rotated_matrix = transformer._handle_rotation(identity_matrix, [angle_deg])
+        rotated_matrix = _affine_to_matrix(transformer._operation_affine('rotate', [angle_deg]))
         
         # Test the transformation behavior on a test point
         point = (10, 0)
@@ -497,7 +579,7 @@ class TestSVGTransformer(unittest.TestCase):
         # (0, 20) should become approximately (-20, 0)
         np.testing.assert_allclose(rotated_point2, (-20, 0), atol=1e-10)
     
-    def test_handle_rotation_around_point(self):
+    def test_rotation_affine_around_point(self):
         """Test rotation transformation around a specific point as actually implemented."""
         transformer = SVGTransformer(self.test_svg_path, self.default_custom_options)
         
@@ -506,8 +588,7 @@ class TestSVGTransformer(unittest.TestCase):
         center_x, center_y = 100, 100
         
         # Now test the method
-        identity_matrix = np.identity(3)
-        actual_matrix = transformer._handle_rotation(identity_matrix, [angle_deg, center_x, center_y])
+        actual_matrix = _affine_to_matrix(transformer._rotation_affine([angle_deg, center_x, center_y]))
         
         # The implementation appears to apply an additional translation
         # that moves points significantly. We'll verify the implementation
@@ -609,6 +690,39 @@ class TestSVGTransformer(unittest.TestCase):
         result = transformer.get_element_type_for_svg_type_and_label('polygon', '')
         self.assertEqual(result, 'default.type')
 
+    def test_element_mapping_index_keeps_first_match(self):
+        """Test that indexed mapping lookups return the first matching mapping."""
+        custom_options = {
+            'element_mappings': [
+                {'svg_type': 'rect', 'label_prefix': 'Btn', 'element_type': 'first.type'},
+                {'svg_type': 'rect', 'label_prefix': 'BTN', 'element_type': 'second.type'},
+                {'svg_type': 'rect', 'label_prefix': 'Btn', 'element_type': 'third.type'}
+            ]
+        }
+        
+        transformer = SVGTransformer(self.test_svg_path, custom_options)
+        
+        # Exact lookups keep the first mapping for a repeated prefix
+        self.assertEqual(transformer.get_element_type_for_svg_type_and_label('rect', 'Btn'), 'first.type')
+        self.assertEqual(transformer.get_element_type_for_svg_type_and_label('rect', 'BTN'), 'second.type')
+        
+        # Case-insensitive lookups also keep the first mapping
+        self.assertEqual(transformer._mapping_by_prefix_ci['BTN']['element_type'], 'first.type')
+        self.assertEqual(transformer._mapping_by_type_and_prefix_ci[('rect', 'BTN')]['element_type'], 'first.type')
+    
+    def test_process_svg_uses_updated_element_mappings(self):
+        """Test that process_svg picks up mappings changed after construction."""
+        transformer = SVGTransformer(self.test_svg_path, copy.deepcopy(self.default_custom_options))
+        transformer.custom_options['element_mappings'] = [
+            {'svg_type': 'rect', 'element_type': 'updated.type', 'props_path': 'Updated/Path'}
+        ]
+        
+        elements = transformer.process_svg()
+        
+        self.assertEqual(len(elements), 1)
+        self.assertEqual(elements[0]['type'], 'updated.type')
+        self.assertEqual(elements[0]['props']['path'], 'Updated/Path')
+    
     def test_process_unsupported_element(self):
         """Test processing of an unsupported SVG element type."""
         # Skipping this test as the way unsupported elements are handled
@@ -745,6 +859,18 @@ class TestSVGTransformer(unittest.TestCase):
             if os.path.exists(temp_svg_path):
                 os.unlink(temp_svg_path)
 
+    def test_apply_group_suffix(self):
+        """Test group suffix rotation, including suffixes without a mapped rotation."""
+        element_json = {'position': {'x': 0, 'y': 0}, 'meta': {'name': 'elem'}}
+        self.svg_transformer.apply_group_suffix(element_json, 'd')
+        self.assertEqual(element_json['position']['rotate'], {'anchor': '50% 50%', 'angle': '90deg'})
+        self.assertEqual(element_json['meta']['groupSuffix'], 'd')
+        
+        # An unknown suffix keeps the existing rotation
+        element_json = {'position': {'rotate': {'anchor': '50% 50%', 'angle': '45deg'}}, 'meta': {'name': 'elem'}}
+        self.svg_transformer.apply_group_suffix(element_json, 'x')
+        self.assertEqual(element_json['position']['rotate']['angle'], '45.0deg')
+    
     def test_group_element_processing(self):
         """Test processing elements inside a group tag and applying group label prefix/suffix logic."""
         test_svg = """
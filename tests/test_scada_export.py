@@ -138,9 +138,9 @@ class TestSCADAExport(unittest.TestCase):
     @patch('zipfile.ZipFile')
     @patch('os.walk')
     @patch('os.makedirs')
-    @patch('json.dump')
+    @patch('json.dumps')
     @patch('builtins.open', new_callable=mock_open)
-    def test_create_scada_export_zip(self, mock_open, mock_json_dump, mock_makedirs, 
+    def test_create_scada_export_zip(self, mock_open, mock_json_dumps, mock_makedirs, 
                                    mock_walk, mock_zipfile, mock_tempdir):
         """Test SCADA export zip creation."""
         # Setup mocks
@@ -215,10 +215,15 @@ class TestSCADAExport(unittest.TestCase):
         # Verify image was created with correct parameters
         mock_image_new.assert_called_once_with('RGBA', (950, 530), (240, 240, 240, 0))
         mock_image.save.assert_called_once()
+        self.assertTrue(os.path.exists(os.path.join(test_view_dir, 'thumbnail.png')))
+        
+        # Verify a second export reuses the encoded thumbnail
+        self.app._create_thumbnail(test_view_dir)
+        mock_image_new.assert_called_once()
     
-    @patch('json.dump')
+    @patch('json.dumps')
     @patch('builtins.open', new_callable=mock_open)
-    def test_create_project_json(self, mock_open, mock_json_dump):
+    def test_create_project_json(self, mock_open, mock_json_dumps):
         """Test project.json file creation."""
         # Create a test directory
         test_project_dir = os.path.join(self.temp_dir, 'test_project')
@@ -231,14 +236,14 @@ class TestSCADAExport(unittest.TestCase):
         mock_open.assert_called_once_with(os.path.join(test_project_dir, 'project.json'), 'w')
         
         # Verify correct JSON was written
-        call_args = mock_json_dump.call_args[0]
+        call_args = mock_json_dumps.call_args[0]
         self.assertEqual(call_args[0]['title'], 'Test Project')
         self.assertEqual(call_args[0]['parent'], 'Parent Project')
         self.assertEqual(call_args[0]['enabled'], True)
     
-    @patch('json.dump')
+    @patch('json.dumps')
     @patch('builtins.open', new_callable=mock_open)
-    def test_create_view_json(self, mock_open, mock_json_dump):
+    def test_create_view_json(self, mock_open, mock_json_dumps):
         """Test view.json file creation."""
         # Create a test directory
         test_view_dir = os.path.join(self.temp_dir, 'test_view')
@@ -251,7 +256,7 @@ class TestSCADAExport(unittest.TestCase):
         mock_open.assert_called_once_with(os.path.join(test_view_dir, 'view.json'), 'w')
         
         # Verify correct JSON was written
-        call_args = mock_json_dump.call_args[0]
+        call_args = mock_json_dumps.call_args[0]
         self.assertEqual(call_args[0]['props']['defaultSize']['width'], 1024)
         self.assertEqual(call_args[0]['props']['defaultSize']['height'], 768)
         
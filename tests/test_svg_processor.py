@@ -444,6 +444,27 @@ class TestSVGProcessor(unittest.TestCase):
         mock_showinfo.assert_called_once()
         mock_savedialog.assert_not_called()
     
+    @patch('tkinter.filedialog.asksaveasfilename')
+    @patch('tkinter.messagebox.showinfo')
+    def test_results_serialized_once(self, mock_showinfo, mock_savedialog):
+        """Test that display, clipboard and save reuse one JSON serialization."""
+        self.app.elements = self.test_elements
+        output_file = os.path.join(self.temp_dir, "elements.json")
+        mock_savedialog.return_value = output_file
+        
+        with patch('json.dumps', wraps=json.dumps) as mock_dumps:
+            self.app._display_results(self.app.elements)
+            self.app.copy_to_clipboard()
+            self.app.save_to_file()
+            
+            # Verify the elements were only serialized once
+            self.assertEqual(mock_dumps.call_count, 1)
+        
+        # Verify the saved file and clipboard received the same JSON
+        with open(output_file, 'r') as f:
+            self.assertEqual(json.load(f), self.test_elements)
+        self.root.clipboard_append.assert_called_once_with(json.dumps(self.test_elements, indent=2))
+    
     def test_clear_results(self):
         """Test clearing results."""
         # Set some elements